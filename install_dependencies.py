@@ -11,15 +11,19 @@ Usage:
 
 import sys
 import subprocess
-import importlib.util
+import functools
+import hashlib
+import json
 import os
+import re
+import site
+import threading
 import time
-import argparse
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Core dependencies (always needed)
 CORE_PACKAGES = [
-    {"name": "Pillow", "pip_name": "pillow>=10.0.0", "description": "Image processing and logo display"}
+    {"name": "Pillow", "pip_name": "pillow>=10.0.0", "import_name": "PIL", "description": "Image processing and logo display"}
 ]
 
 # Desktop-specific dependencies (tkinter app)
@@ -29,31 +33,216 @@ DESKTOP_PACKAGES = []
 # Web-specific dependencies (not currently used)
 WEB_PACKAGES = []
 
+# Splits a pip spec like "pillow>=10.0.0" or "foo[extra]" at the first
+# version/extras marker, leaving just the package name.
+_SPEC_RE = re.compile(r'[><=\[!~]')
+
+# PEP 503-style name normalization: case-fold and collapse runs of
+# '-', '_' and '.' so "Pillow", "pillow" and "pillow.heif" style names
+# all compare consistently, matching what pip does internally.
+_NORMALIZE_RE = re.compile(r"[-_.]+")
+
+def _normalize_name(name):
+    return _NORMALIZE_RE.sub("_", name).lower()
+
+# On POSIX, subprocess can only take its posix_spawn fast path (instead of
+# the heavier fork+exec) when close_fds is False and no preexec_fn is set.
+# pip inherits nothing sensitive here, so opt in outside Windows.
+_SPAWN_KWARGS = {} if os.name == 'nt' else {"close_fds": False}
+
+# Computed once: whether we should hold the console open on exit (Windows
+# double-click launches have no attached tty). Saves re-doing the isatty
+# syscall in both exit paths.
+_IS_WIN_NONTTY = (os.name == 'nt') and (not sys.stdin.isatty())
+
+# Precomputed pip command prefix. --disable-pip-version-check skips pip's
+# self-update HTTPS round-trip and --no-input keeps pip from ever blocking
+# on a prompt of its own. --no-compile defers bytecode compilation, which
+# dominates install time for large wheels; compile_installed_packages()
+# makes up for it once, in parallel, after all installs finish.
+_PIP_INSTALL_FLAGS = ("--disable-pip-version-check", "--no-input", "--no-compile")
+_PIP_INSTALL_CMD = (sys.executable, "-m", "pip", "install", *_PIP_INSTALL_FLAGS)
+
+@functools.lru_cache(maxsize=None)
+def _pip_inprocess_main():
+    """Return pip's in-process entry point, or None if it is unavailable.
+
+    pip has no batch/REPL mode, so the closest thing to a persistent pip
+    worker is importing pip once into this process and dispatching install
+    commands at it. The interpreter startup and pip import cost is then
+    paid once instead of on every invocation. pip._internal is a private
+    API, so callers must fall back to the subprocess path when this
+    returns None or the call raises.
+    """
+    try:
+        from pip._internal.cli.main import main
+        return main
+    except ImportError:
+        return None
+
+@functools.lru_cache(maxsize=None)
+def _installed_names():
+    """Build the set of installed import/distribution names in one scan.
+
+    A single packages_distributions() call walks sys.path once, instead of
+    one find_spec() path walk (with its file stats) per package checked.
+    importlib.metadata is imported here rather than at module level so the
+    marker/requirements.txt fast paths never pay for it; the lru_cache
+    means the import happens at most once.
+    """
+    import importlib.metadata
+    names = set()
+    for import_name, dist_names in importlib.metadata.packages_distributions().items():
+        names.add(_normalize_name(import_name))
+        for dist_name in dist_names:
+            names.add(_normalize_name(dist_name))
+    return names
+
+@functools.lru_cache(maxsize=None)
 def is_package_installed(package_name):
     """Check if a Python package is installed"""
-    # Handle packages with special characters
-    import_name = package_name.lower().replace("-", "_")
-    return importlib.util.find_spec(import_name) is not None
+    return _normalize_name(package_name) in _installed_names()
 
 def install_package(package_name):
     """Install a package using pip"""
     print(f"Installing {package_name}...")
+    # Prefer the already-imported pip to skip a full interpreter startup,
+    # but only on the main thread: pip's internals are not thread-safe and
+    # the fallback path in install_packages() runs in worker threads.
+    pip_main = _pip_inprocess_main()
+    if pip_main is not None and threading.current_thread() is threading.main_thread():
+        try:
+            if pip_main(["install", *_PIP_INSTALL_FLAGS, package_name]) == 0:
+                return True
+            print(f"Failed to install {package_name}.")
+            return False
+        except Exception:
+            pass  # pip._internal is private API; fall through to subprocess
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", package_name])
+        subprocess.check_call((*_PIP_INSTALL_CMD, package_name), **_SPAWN_KWARGS)
         return True
     except subprocess.CalledProcessError as e:
         print(f"Failed to install {package_name}. Error: {e}")
         return False
 
-def check_requirements_txt():
+def unsatisfied_package_names(pip_names):
+    """Ask pip which of the given specs actually need installing.
+
+    A single 'pip install --dry-run --report' resolves every spec (version
+    constraints included, which the import-name check cannot see) in one
+    subprocess instead of one resolver run per package. Returns the set of
+    normalized distribution names pip plans to install, or None when the
+    report could not be produced (old pip, network failure, ...).
+    """
+    if not pip_names:
+        return set()
+    try:
+        output = subprocess.check_output(
+            (*_PIP_INSTALL_CMD, "--dry-run", "--quiet", "--report", "-", *pip_names),
+            stderr=subprocess.DEVNULL, **_SPAWN_KWARGS)
+        report = json.loads(output)
+        return {_normalize_name(item["metadata"]["name"])
+                for item in report.get("install", [])}
+    except (subprocess.CalledProcessError, OSError, ValueError, KeyError):
+        return None
+
+def install_packages(pip_names, jobs=4):
+    """Install several packages with a single pip invocation.
+
+    Batching avoids paying Python startup and pip import costs once per
+    package. If the batched call fails, fall back to installing each package
+    individually so we can report exactly which specs failed. The fallback
+    installs run in parallel (installs are I/O-bound, so threads are enough).
+    Returns the set of pip specs that could not be installed.
+    """
+    if not pip_names:
+        return set()
+
+    print(f"Installing {len(pip_names)} packages in one pip call...")
+    pip_main = _pip_inprocess_main()
+    if pip_main is not None:
+        try:
+            if pip_main(["install", *_PIP_INSTALL_FLAGS, *pip_names]) == 0:
+                return set()
+            print("Batched install failed. Retrying packages individually...")
+        except Exception as e:
+            print(f"In-process pip failed ({e}), falling back to subprocess...")
+            pip_main = None
+    if pip_main is None:
+        try:
+            subprocess.check_call((*_PIP_INSTALL_CMD, *pip_names), **_SPAWN_KWARGS)
+            return set()
+        except subprocess.CalledProcessError as e:
+            print(f"Batched install failed (exit {e.returncode}). Retrying packages individually...")
+
+    failed = set()
+    workers = min(max(jobs, 1), 8, len(pip_names))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(install_package, pip_name): pip_name for pip_name in pip_names}
+        for future in as_completed(futures):
+            if not future.result():
+                failed.add(futures[future])
+    return failed
+
+def compile_installed_packages():
+    """Bytecode-compile site-packages once, using all cores.
+
+    Installs run with --no-compile, so pay the (CPU-bound) .pyc compilation
+    cost here in a single parallel compileall pass instead of serially
+    inside every pip install.
+    """
+    try:
+        site_dir = site.getsitepackages()[0]
+    except (AttributeError, IndexError):
+        return  # some embedded/virtual layouts don't expose site-packages
+    subprocess.call([sys.executable, "-m", "compileall", "-q", "-j", "0", site_dir],
+                    **_SPAWN_KWARGS)
+
+# Marker recording the content hash of the last successfully installed
+# requirements.txt, so re-runs on an unchanged file can skip all work.
+_MARKER_PATH = os.path.join(os.path.expanduser("~"), ".cache", "florian-pipeline", "installed.marker")
+
+def requirements_digest(requirements_path):
+    """Content hash of the requirements file, or None if unreadable"""
+    try:
+        with open(requirements_path, "rb") as f:
+            return hashlib.blake2b(f.read()).hexdigest()
+    except OSError:
+        return None
+
+def marker_matches(digest):
+    """Check whether the cached install marker matches this digest"""
+    if digest is None:
+        return False
+    try:
+        with open(_MARKER_PATH) as f:
+            return f.read().strip() == digest
+    except OSError:
+        return False
+
+def write_marker(digest):
+    """Record a successful install of the given requirements digest"""
+    if digest is None:
+        return
+    try:
+        os.makedirs(os.path.dirname(_MARKER_PATH), exist_ok=True)
+        with open(_MARKER_PATH, "w") as f:
+            f.write(digest)
+    except OSError:
+        pass  # cache is best-effort; never fail the install over it
+
+def check_requirements_txt(requirements_path="requirements.txt", assume_yes=False):
     """Check if requirements.txt exists and offer to use it"""
-    requirements_path = Path("requirements.txt")
-    if requirements_path.exists():
+    if os.path.isfile(requirements_path):
         print(f"Found requirements.txt at: {requirements_path}")
-        use_requirements = input("Would you like to install from requirements.txt instead? (y/n): ")
+        if assume_yes:
+            use_requirements = 'y'
+        else:
+            use_requirements = input("Would you like to install from requirements.txt instead? (y/n): ")
         if use_requirements.lower() in ('y', 'yes'):
             try:
-                subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", str(requirements_path)])
+                subprocess.check_call((*_PIP_INSTALL_CMD, "-r", requirements_path))
+                compile_installed_packages()
                 print("Successfully installed all packages from requirements.txt!")
                 return True
             except subprocess.CalledProcessError as e:
@@ -62,14 +251,74 @@ def check_requirements_txt():
                 return False
     return False
 
-def main():
+def _build_arg_parser():
+    """Full argparse parser, only built for --help; see parse_args()."""
+    import argparse
     parser = argparse.ArgumentParser(description="Install Florian Dheer Pipeline dependencies")
     parser.add_argument("--web-only", action="store_true", help="Install only web interface dependencies")
     parser.add_argument("--desktop-only", action="store_true", help="Install only desktop application dependencies")
     parser.add_argument("--skip-optional", action="store_true", help="Skip optional packages")
-    
-    args = parser.parse_args()
-    
+    parser.add_argument("--jobs", type=int, default=4, metavar="N",
+                        help="Number of parallel installs when falling back to per-package mode (default: 4)")
+    parser.add_argument("--requirements", default="requirements.txt", metavar="PATH",
+                        help="Path to a requirements file to offer installing from (default: requirements.txt)")
+    parser.add_argument("--assume-yes", action="store_true",
+                        help="Answer yes to all prompts (for non-interactive/CI use)")
+    return parser
+
+def parse_args(argv=None):
+    """Hand-rolled flag scan to keep startup light.
+
+    argparse pulls in gettext and textwrap — ~10-20ms of import time on
+    every run of a script whose common case is just confirming Pillow is
+    present. The scan handles our handful of flags directly and only
+    builds the real argparse parser for --help.
+    """
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if "-h" in argv or "--help" in argv:
+        _build_arg_parser().parse_args(argv)  # prints help and exits
+
+    class Args:
+        web_only = False
+        desktop_only = False
+        skip_optional = False
+        assume_yes = False
+        jobs = 4
+        requirements = "requirements.txt"
+
+    args = Args()
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--web-only":
+            args.web_only = True
+        elif arg == "--desktop-only":
+            args.desktop_only = True
+        elif arg == "--skip-optional":
+            args.skip_optional = True
+        elif arg == "--assume-yes":
+            args.assume_yes = True
+        elif arg == "--jobs" and i + 1 < len(argv):
+            i += 1
+            args.jobs = int(argv[i])
+        elif arg.startswith("--jobs="):
+            args.jobs = int(arg.split("=", 1)[1])
+        elif arg == "--requirements" and i + 1 < len(argv):
+            i += 1
+            args.requirements = argv[i]
+        elif arg.startswith("--requirements="):
+            args.requirements = arg.split("=", 1)[1]
+        else:
+            # Fail fast on anything unrecognized, like the argparse this
+            # replaced; the real parser produces the canonical usage/error
+            # output and exits
+            _build_arg_parser().parse_args(argv)
+        i += 1
+    return args
+
+def main():
+    args = parse_args()
+
     print("=" * 60)
     print("Florian Dheer Pipeline - Enhanced Dependency Installer")
     print("=" * 60)
@@ -77,8 +326,15 @@ def main():
     print(f"Pip executable: {sys.executable} -m pip")
     print("=" * 60)
     
+    # Skip everything if this exact requirements file was already installed
+    digest = requirements_digest(args.requirements)
+    if marker_matches(digest):
+        print(f"\n{args.requirements} unchanged since last successful install - everything up-to-date!")
+        return
+
     # Check if we should use requirements.txt
-    if not (args.web_only or args.desktop_only) and check_requirements_txt():
+    if not (args.web_only or args.desktop_only) and check_requirements_txt(args.requirements, args.assume_yes):
+        write_marker(digest)
         return
     
     # Determine which packages to install
@@ -100,26 +356,34 @@ def main():
         print("Skipping optional packages")
     
     print("=" * 60)
-    
-    missing_packages = []
-    optional_missing = []
-    
-    # Check for required packages
-    print("Checking for required packages...")
+
+    # Resolve check names once: prefer an explicit import_name (the module a
+    # package actually installs, e.g. Pillow -> PIL), else strip version
+    # constraints from the pip spec.
     for package in packages_to_check:
-        sys.stdout.write(f"  - {package['name']} ({package['description']}): ")
-        
-        # Extract package name for import check (remove version constraints)
-        import_name = package['pip_name'].split('>=')[0].split('==')[0].split('[')[0]
-        
-        if is_package_installed(import_name):
-            sys.stdout.write("Already installed ✓\n")
-        else:
-            sys.stdout.write("Missing ✗\n")
-            if package.get("optional", False):
-                optional_missing.append(package)
-            else:
-                missing_packages.append(package)
+        package['_import_name'] = package.get('import_name') or _SPEC_RE.split(package['pip_name'], 1)[0]
+
+    print("Checking for required packages...")
+    if len(packages_to_check) == 1:
+        # Specialized path for the common one-dependency configuration:
+        # the list-building and batched-report machinery below is pure
+        # overhead when there is exactly one statically known package.
+        package = packages_to_check[0]
+        installed = is_package_installed(package['_import_name'])
+        print(f"  - {package['name']} ({package['description']}): "
+              + ("Already installed ✓" if installed else "Missing ✗"))
+        missing = [] if installed else [package]
+        missing_packages = [] if package.get("optional", False) else missing
+        optional_missing = missing if package.get("optional", False) else []
+    else:
+        # Check every package, then emit the whole report in one write
+        # (one syscall instead of two per package - noticeable on slow CI logs)
+        statuses = [(p, is_package_installed(p['_import_name'])) for p in packages_to_check]
+        sys.stdout.write("".join(
+            f"  - {p['name']} ({p['description']}): " + ("Already installed ✓\n" if ok else "Missing ✗\n")
+            for p, ok in statuses))
+        missing_packages = [p for p, ok in statuses if not ok and not p.get("optional", False)]
+        optional_missing = [p for p, ok in statuses if not ok and p.get("optional", False)]
     
     # Handle missing packages
     total_missing = len(missing_packages) + len(optional_missing)
@@ -139,23 +403,43 @@ def main():
             for package in optional_missing:
                 print(f"  - {package['name']} ({package['pip_name']}) - {package['description']}")
         
-        install_confirmation = input("\nWould you like to install these packages now? (y/n): ")
+        if args.assume_yes:
+            install_confirmation = 'y'
+        else:
+            install_confirmation = input("\nWould you like to install these packages now? (y/n): ")
         
         if install_confirmation.lower() in ('y', 'yes'):
             print("\nInstalling packages...")
             
             all_packages = missing_packages + optional_missing
+
+            # Let pip's resolver confirm what is really missing in one shot;
+            # the import-name check can miss already-satisfied distributions.
+            planned = unsatisfied_package_names([p['pip_name'] for p in all_packages])
+            if planned is not None:
+                # Compare distribution names (from the pip spec), not
+                # _import_name: pip reports "pillow", never "PIL"
+                satisfied = [p for p in all_packages
+                             if _normalize_name(_SPEC_RE.split(p['pip_name'], 1)[0])
+                             not in planned]
+                for package in satisfied:
+                    print(f"  - {package['name']} already satisfied per pip, skipping")
+                all_packages = [p for p in all_packages if p not in satisfied]
+
+            failed_specs = install_packages([p['pip_name'] for p in all_packages], jobs=args.jobs)
             failed_packages = []
-            
+
             for package in all_packages:
-                success = install_package(package['pip_name'])
-                if success:
+                if package['pip_name'] not in failed_specs:
                     print(f"  - {package['name']} installed successfully ✓")
                 else:
                     failed_packages.append(package)
                     status = "(optional - continuing)" if package.get("optional", False) else "(required - may cause issues)"
                     print(f"  - {package['name']} installation failed ✗ {status}")
             
+            if all_packages:
+                compile_installed_packages()
+
             if failed_packages:
                 print(f"\nWarning: {len(failed_packages)} packages failed to install:")
                 for package in failed_packages:
@@ -187,7 +471,7 @@ def main():
     print("Dependency installation complete!")
     
     # Keep console window open on Windows if double-clicked
-    if os.name == 'nt' and not sys.stdin.isatty():
+    if _IS_WIN_NONTTY:
         print("\nPress Enter to exit...")
         input()
 
@@ -200,7 +484,7 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"\nAn error occurred: {e}")
         print("Please try running this script with administrator privileges or manually install the required packages.")
-        if os.name == 'nt' and not sys.stdin.isatty():
+        if _IS_WIN_NONTTY:
             print("\nPress Enter to exit...")
             input()
         sys.exit(1)
\ No newline at end of file
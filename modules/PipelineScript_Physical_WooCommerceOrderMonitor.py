@@ -10,15 +10,22 @@ Description: Automatically monitor WooCommerce orders and organize order folders
 import os
 import sys
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
+from tkinter import ttk, filedialog, messagebox, scrolledtext
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 import json
+import shutil
+import queue
+import sqlite3
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import logging
+from logging.handlers import RotatingFileHandler
 from typing import Dict, List, Optional
 import base64
 
@@ -98,14 +105,48 @@ class Config:
                 else:
                     default[key] = value
 
+    @property
+    def wc(self) -> Dict:
+        """The 'woocommerce' config section"""
+        return self.config['woocommerce']
+
+    @property
+    def mon(self) -> Dict:
+        """The 'monitoring' config section"""
+        return self.config['monitoring']
+
+    @property
+    def log(self) -> Dict:
+        """The 'logging' config section"""
+        return self.config['logging']
+
+    @property
+    def filters(self) -> Dict:
+        """The 'filters' config section"""
+        return self.config['filters']
+
+    @property
+    def folder_structure(self) -> Dict:
+        """The 'folder_structure' config section"""
+        return self.config['folder_structure']
+
+    @property
+    def documents(self) -> Dict:
+        """The 'documents' config section"""
+        return self.config['documents']
+
     def save_config(self, config: Optional[Dict] = None):
         """Save configuration to file"""
         if config:
             self.config = config
 
         try:
-            with open(self.config_file, 'w') as f:
+            # Write-then-rename so a crash mid-write never leaves a
+            # truncated config behind
+            tmp = self.config_file.with_suffix('.tmp')
+            with open(tmp, 'w') as f:
                 json.dump(self.config, f, indent=4)
+            os.replace(tmp, self.config_file)
             return True
         except Exception as e:
             print(f"Error saving config: {e}")
@@ -121,39 +162,91 @@ class ProcessedOrdersTracker:
 
     def __init__(self, config: Config):
         self.config = config
-        self.tracker_file = Path(config.config['monitoring']['processed_orders_file'])
-        self.processed_orders = self.load_tracker()
-
-    def load_tracker(self) -> Dict:
-        """Load processed orders from file"""
-        if self.tracker_file.exists():
-            try:
-                with open(self.tracker_file, 'r') as f:
-                    return json.load(f)
-            except:
-                return {}
-        return {}
+        self.tracker_file = Path(config.mon['processed_orders_file'])
+        self.db_file = self.tracker_file.with_suffix('.sqlite')
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.db_file), check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS processed (
+                order_id TEXT PRIMARY KEY,
+                processed_at TEXT,
+                folder_path TEXT,
+                documents TEXT
+            )
+        """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )
+        """)
+        self._import_legacy_json()
+        self._seen = {row[0] for row in
+                      self.conn.execute("SELECT order_id FROM processed")}
+        row = self.conn.execute(
+            "SELECT value FROM meta WHERE key = 'last_seen_order_date'").fetchone()
+        self.last_seen_order_date = row[0] if row else None
+
+    def set_last_seen_order_date(self, date_str: str):
+        """Advance the newest-seen-order watermark (never moves backwards)"""
+        with self._lock:
+            if self.last_seen_order_date and date_str <= self.last_seen_order_date:
+                return
+            self.last_seen_order_date = date_str
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('last_seen_order_date', ?)",
+                (date_str,))
+            self.conn.commit()
+
+    def _import_legacy_json(self):
+        """One-time import of the old JSON tracker file"""
+        if not self.tracker_file.exists():
+            return
+        try:
+            with open(self.tracker_file, 'r') as f:
+                legacy = json.load(f)
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO processed VALUES (?, ?, ?, ?)",
+                [(order_id, entry.get('processed_at', ''),
+                  entry.get('folder_path', ''),
+                  json.dumps(entry.get('documents', {})))
+                 for order_id, entry in legacy.items()])
+            self.conn.commit()
+            self.tracker_file.rename(self.tracker_file.with_name(self.tracker_file.name + '.bak'))
+        except Exception as e:
+            logging.error(f"Failed to import legacy tracker: {e}")
 
     def save_tracker(self):
-        """Save processed orders to file"""
+        """Flush pending tracker writes to disk"""
         try:
-            with open(self.tracker_file, 'w') as f:
-                json.dump(self.processed_orders, f, indent=4)
+            with self._lock:
+                self.conn.commit()
         except Exception as e:
             logging.error(f"Failed to save tracker: {e}")
 
     def is_processed(self, order_id: str) -> bool:
         """Check if order has been processed"""
-        return str(order_id) in self.processed_orders
-
-    def mark_processed(self, order_id: str, folder_path: str, documents: Dict):
-        """Mark order as processed"""
-        self.processed_orders[str(order_id)] = {
-            "processed_at": datetime.now().isoformat(),
-            "folder_path": folder_path,
-            "documents": documents
-        }
-        self.save_tracker()
+        return str(order_id) in self._seen
+
+    def count(self) -> int:
+        """Number of processed orders on record"""
+        return len(self._seen)
+
+    def mark_processed(self, order_id: str, folder_path: str, documents: Dict,
+                       flush: bool = False):
+        """Mark order as processed (safe to call from worker threads)
+
+        With flush=False the row is only queued on the connection; the
+        caller is expected to call save_tracker() once after its batch.
+        """
+        with self._lock:
+            self._seen.add(str(order_id))
+            self.conn.execute(
+                "INSERT OR REPLACE INTO processed VALUES (?, ?, ?, ?)",
+                (str(order_id), datetime.now().isoformat(), folder_path,
+                 json.dumps(documents)))
+        if flush:
+            self.save_tracker()
 
 
 # ====================================
@@ -165,7 +258,7 @@ class WooCommerceClient:
 
     def __init__(self, config: Config):
         self.config = config
-        wc_config = config.config['woocommerce']
+        wc_config = config.wc
 
         self.base_url = wc_config['url'].rstrip('/')
         self.api_url = f"{self.base_url}/wp-json/{wc_config['api_version']}"
@@ -173,41 +266,86 @@ class WooCommerceClient:
             wc_config['consumer_key'],
             wc_config['consumer_secret']
         )
-        self.session = requests.Session()
-        self.session.auth = self.auth
+        # Keep-alive sessions with pooling and retries: repeat requests in
+        # one check pass reuse the TCP+TLS connection instead of paying a
+        # fresh handshake each time. Downloads go through a separate
+        # unauthenticated session so the store API credentials are never
+        # sent to third-party label hosts.
+        def _make_session(auth=None):
+            session = requests.Session()
+            session.auth = auth
+            adapter = HTTPAdapter(
+                pool_connections=4, pool_maxsize=8,
+                max_retries=Retry(total=3, backoff_factor=0.3))
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            return session
+
+        self.session = _make_session(self.auth)
+        self.download_session = _make_session()
+        self._conn_ok_until = 0.0
 
     def test_connection(self) -> tuple[bool, str]:
-        """Test WooCommerce API connection"""
+        """Test WooCommerce API connection
+
+        A success is cached for 30 seconds so flipping Start/Stop/Start
+        doesn't block the GUI on a fresh round-trip each time.
+        """
+        if time.monotonic() < self._conn_ok_until:
+            return True, "Connection successful (cached)"
+
         try:
-            response = self.session.get(f"{self.api_url}/system_status")
+            response = self.session.get(f"{self.api_url}/system_status", timeout=(3, 10))
             if response.status_code == 200:
+                self._conn_ok_until = time.monotonic() + 30
                 return True, "Connection successful"
             else:
                 return False, f"API returned status {response.status_code}"
         except Exception as e:
             return False, str(e)
 
-    def get_recent_orders(self, hours: int = 48) -> List[Dict]:
-        """Get recent orders from WooCommerce"""
+    def get_recent_orders(self, hours: int = 48, since: Optional[str] = None) -> List[Dict]:
+        """Get recent orders from WooCommerce
+
+        since is an optional ISO timestamp watermark; only orders
+        modified after it are requested, so steady-state polls don't
+        re-download and re-parse the same unchanged orders every few
+        minutes. Filtering on modification (not creation) date matters:
+        an order created as 'pending' only enters the status filter once
+        it transitions to 'processing', and that transition bumps
+        date_modified, so it is still picked up however old it is.
+        """
         try:
             from datetime import datetime, timedelta
             after_date = (datetime.now() - timedelta(hours=hours)).isoformat()
+            if since and since > after_date:
+                after_date = since
 
             # Get filter settings
-            filters = self.config.config['filters']
+            filters = self.config.filters
 
             params = {
-                'after': after_date,
+                'modified_after': after_date,
                 'per_page': 100,
                 'orderby': 'date',
-                'order': 'desc'
+                'order': 'desc',
+                # Only request the fields the pipeline actually reads;
+                # full order objects are often 5-10x larger on the wire
+                '_fields': ','.join([
+                    'id', 'number', 'date_created', 'date_modified', 'status',
+                    'currency', 'currency_symbol', 'total',
+                    'billing', 'shipping', 'shipping_lines', 'line_items',
+                    'meta_data', 'payment_method', 'payment_method_title',
+                    'transaction_id', 'customer_note'
+                ])
             }
 
             # Add status filter if specified
             if filters.get('order_statuses'):
                 params['status'] = ','.join(filters['order_statuses'])
 
-            response = self.session.get(f"{self.api_url}/orders", params=params)
+            response = self.session.get(f"{self.api_url}/orders", params=params,
+                                        timeout=(3, 30))
             response.raise_for_status()
 
             return response.json()
@@ -218,7 +356,7 @@ class WooCommerceClient:
     def get_order_details(self, order_id: int) -> Optional[Dict]:
         """Get detailed order information"""
         try:
-            response = self.session.get(f"{self.api_url}/orders/{order_id}")
+            response = self.session.get(f"{self.api_url}/orders/{order_id}", timeout=(3, 10))
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -227,7 +365,7 @@ class WooCommerceClient:
 
     def matches_filters(self, order: Dict) -> bool:
         """Check if order matches configured filters"""
-        filters = self.config.config['filters']
+        filters = self.config.filters
 
         # Check shipping method filter
         if filters.get('shipping_methods'):
@@ -245,44 +383,51 @@ class WooCommerceClient:
 
         return True
 
-    def has_bpost_shipping(self, order: Dict) -> bool:
-        """Check if order uses bpost shipping"""
+    LABEL_META_KEYS = frozenset([
+        '_bpost_label_url',
+        '_bpost_shipping_label',
+        'bpost_label',
+        '_shipping_label_url',
+        '_bpost_label_pdf',
+        'Bpost_trackingurl'
+    ])
+
+    def analyze_order(self, order: Dict) -> tuple[bool, Optional[str]]:
+        """Check for bpost shipping and extract the label URL in one pass
+
+        Returns (has_bpost_shipping, label_url). Walks shipping_lines and
+        meta_data exactly once instead of once per question.
+        """
+        has_bpost = False
+        label_url = None
+
         for shipping_line in order.get('shipping_lines', []):
             method_id = shipping_line.get('method_id', '').lower()
             method_title = shipping_line.get('method_title', '').lower()
 
             if 'bpost' in method_id or 'bpost' in method_title:
-                return True
-
-        for meta in order.get('meta_data', []):
-            key = meta.get('key', '').lower()
-            if 'bpost' in key:
-                return True
-
-        return False
-
-    def get_bpost_label_url(self, order: Dict) -> Optional[str]:
-        """Extract bpost label URL from order metadata"""
-        label_meta_keys = [
-            '_bpost_label_url',
-            '_bpost_shipping_label',
-            'bpost_label',
-            '_shipping_label_url',
-            '_bpost_label_pdf',
-            'Bpost_trackingurl'
-        ]
+                has_bpost = True
+                break
 
         for meta in order.get('meta_data', []):
             key = meta.get('key', '')
-            if key in label_meta_keys:
-                return meta.get('value')
+            if label_url is None and key in self.LABEL_META_KEYS:
+                label_url = meta.get('value')
+            if not has_bpost and 'bpost' in key.lower():
+                has_bpost = True
+            if has_bpost and label_url is not None:
+                break
 
-        return None
+        return has_bpost, label_url
+
+    def has_bpost_shipping(self, order: Dict) -> bool:
+        """Check if order uses bpost shipping"""
+        return self.analyze_order(order)[0]
 
     def get_bpost_label_from_db(self, order_id: int) -> Optional[str]:
         """Query custom wp_Bpost table for label URL via WordPress AJAX endpoint"""
         try:
-            wc_config = self.config.config['woocommerce']
+            wc_config = self.config.wc
             base_url = wc_config['url'].rstrip('/')
             secret_key = wc_config.get('monitor_secret_key', '')
 
@@ -298,7 +443,7 @@ class WooCommerceClient:
                 'secret': secret_key
             }
 
-            response = requests.get(endpoint, params=params, timeout=10)
+            response = self.download_session.get(endpoint, params=params, timeout=10)
 
             if response.status_code == 200:
                 try:
@@ -327,7 +472,7 @@ class DocumentManager:
     def __init__(self, config: Config, wc_client: WooCommerceClient):
         self.config = config
         self.wc_client = wc_client
-        self.base_dir = Path(config.config['monitoring']['base_directory'])
+        self.base_dir = Path(config.mon['base_directory'])
         self.base_dir.mkdir(parents=True, exist_ok=True)
 
     def create_order_folder(self, order: Dict) -> Path:
@@ -345,7 +490,7 @@ class DocumentManager:
         customer_name = self._sanitize_filename(customer_name)
 
         # Build folder name based on format
-        naming_format = self.config.config['folder_structure']['naming_format']
+        naming_format = self.config.folder_structure['naming_format']
         folder_name = naming_format.format(
             order_number=order_number,
             order_id=order_id,
@@ -353,7 +498,7 @@ class DocumentManager:
         )
 
         # Add date if configured
-        if self.config.config['folder_structure'].get('include_date'):
+        if self.config.folder_structure.get('include_date'):
             date_str = datetime.now().strftime('%Y%m%d')
             folder_name = f"{date_str}_{folder_name}"
 
@@ -362,7 +507,7 @@ class DocumentManager:
         order_folder.mkdir(parents=True, exist_ok=True)
 
         # Create subfolder for documents if configured
-        if self.config.config['folder_structure'].get('subfolder_documents'):
+        if self.config.folder_structure.get('subfolder_documents'):
             docs_folder = order_folder / "Documents"
             docs_folder.mkdir(exist_ok=True)
 
@@ -408,7 +553,7 @@ class DocumentManager:
 
                 # Construct URL if we have invoice number
                 if invoice_number:
-                    wc_config = self.config.config['woocommerce']
+                    wc_config = self.config.wc
                     base_url = wc_config['url'].rstrip('/')
                     # Try common WooCommerce PDF Invoices plugin endpoint
                     invoice_url = f"{base_url}/?action=generate_wpo_wcpdf&template_type=invoice&order_ids={order['id']}&my-account"
@@ -418,28 +563,31 @@ class DocumentManager:
                 return None
 
             # Download invoice
-            doc_config = self.config.config['documents']
+            doc_config = self.config.documents
             filename = doc_config['invoice_filename'].format(
                 order_number=order.get('number', order['id']),
                 order_id=order['id']
             )
 
-            if self.config.config['folder_structure'].get('subfolder_documents'):
+            if self.config.folder_structure.get('subfolder_documents'):
                 invoice_path = order_folder / "Documents" / filename
             else:
                 invoice_path = order_folder / filename
 
-            # Download the PDF
-            response = requests.get(invoice_url, timeout=30)
-            response.raise_for_status()
+            # Stream the PDF straight to disk: peak memory stays at one
+            # 64KB buffer instead of the whole document
+            with self.wc_client.download_session.get(
+                    invoice_url, timeout=30, stream=True) as response:
+                response.raise_for_status()
 
-            # Verify it's a PDF
-            content_type = response.headers.get('content-type', '').lower()
-            if 'pdf' not in content_type and not invoice_url.endswith('.pdf'):
-                logging.warning(f"Downloaded file might not be a PDF: {content_type}")
+                # Verify it's a PDF
+                content_type = response.headers.get('content-type', '').lower()
+                if 'pdf' not in content_type and not invoice_url.endswith('.pdf'):
+                    logging.warning(f"Downloaded file might not be a PDF: {content_type}")
 
-            with open(invoice_path, 'wb') as f:
-                f.write(response.content)
+                response.raw.decode_content = True
+                with open(invoice_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=65536)
 
             logging.info(f"Downloaded invoice: {invoice_path}")
             return str(invoice_path)
@@ -452,32 +600,34 @@ class DocumentManager:
         """Download shipping label if available"""
         try:
             # Try to get label URL from metadata first
-            label_url = self.wc_client.get_bpost_label_url(order)
+            has_bpost, label_url = self.wc_client.analyze_order(order)
 
             # If not in metadata, try database query
-            if not label_url and self.wc_client.has_bpost_shipping(order):
+            if not label_url and has_bpost:
                 label_url = self.wc_client.get_bpost_label_from_db(order['id'])
 
             if not label_url:
                 return None
 
             # Download label
-            doc_config = self.config.config['documents']
+            doc_config = self.config.documents
             filename = doc_config['label_filename'].format(
                 order_number=order.get('number', order['id']),
                 order_id=order['id']
             )
 
-            if self.config.config['folder_structure'].get('subfolder_documents'):
+            if self.config.folder_structure.get('subfolder_documents'):
                 label_path = order_folder / "Documents" / filename
             else:
                 label_path = order_folder / filename
 
-            response = requests.get(label_url, timeout=30)
-            response.raise_for_status()
-
-            with open(label_path, 'wb') as f:
-                f.write(response.content)
+            # Stream the label straight to disk (see download_invoice)
+            with self.wc_client.download_session.get(
+                    label_url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                with open(label_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=65536)
 
             logging.info(f"Downloaded shipping label: {label_path}")
             return str(label_path)
@@ -489,13 +639,13 @@ class DocumentManager:
     def create_order_details_file(self, order: Dict, order_folder: Path) -> Optional[str]:
         """Create a text file with order details"""
         try:
-            doc_config = self.config.config['documents']
+            doc_config = self.config.documents
             filename = doc_config['order_details_filename'].format(
                 order_number=order.get('number', order['id']),
                 order_id=order['id']
             )
 
-            if self.config.config['folder_structure'].get('subfolder_documents'):
+            if self.config.folder_structure.get('subfolder_documents'):
                 details_path = order_folder / "Documents" / filename
             else:
                 details_path = order_folder / filename
@@ -599,24 +749,34 @@ class OrderMonitor:
         self.wc_client = WooCommerceClient(config)
         self.doc_manager = DocumentManager(config, self.wc_client)
         self.tracker = ProcessedOrdersTracker(config)
-        self.running = False
+        self._stop_event = threading.Event()
+        self._stop_event.set()
         self.callback = None
 
     def set_callback(self, callback):
         """Set callback function for status updates"""
         self.callback = callback
 
-    def log_status(self, message: str, level: str = "info"):
-        """Log status message"""
+    _LOG_LEVELS = {"error": logging.ERROR, "warning": logging.WARNING}
+
+    def log_status(self, message: str, *args, level: str = "info"):
+        """Log status message
+
+        Positional args are %-interpolated lazily, so messages that end
+        up nowhere (no callback and logging below threshold) are never
+        actually built.
+        """
+        level_int = self._LOG_LEVELS.get(level, logging.INFO)
+        if not self.callback and not logging.getLogger().isEnabledFor(level_int):
+            return
+
+        if args:
+            message = message % args
+
         if self.callback:
             self.callback(message, level)
 
-        if level == "error":
-            logging.error(message)
-        elif level == "warning":
-            logging.warning(message)
-        else:
-            logging.info(message)
+        logging.log(level_int, message)
 
     def process_order(self, order: Dict) -> bool:
         """Process a single order"""
@@ -629,109 +789,156 @@ class OrderMonitor:
 
         # Check if matches filters
         if not self.wc_client.matches_filters(order):
-            self.log_status(f"Order #{order_number} doesn't match filters", "info")
+            self.log_status("Order #%s doesn't match filters", order_number)
             return False
 
-        self.log_status(f"Processing order #{order_number}...", "info")
+        self.log_status("Processing order #%s...", order_number)
 
         try:
             # Create order folder
             order_folder = self.doc_manager.create_order_folder(order)
-            self.log_status(f"Created folder: {order_folder.name}", "success")
+            self.log_status("Created folder: %s", order_folder.name, level="success")
 
             documents = {}
 
             # Generate/download documents based on configuration
-            monitor_config = self.config.config['monitoring']
+            monitor_config = self.config.mon
 
             # Invoice
             if monitor_config.get('download_invoices', True):
                 invoice_path = self.doc_manager.download_invoice(order, order_folder)
                 if invoice_path:
                     documents['invoice'] = invoice_path
-                    self.log_status(f"✓ Invoice downloaded", "success")
+                    self.log_status("✓ Invoice downloaded", level="success")
                 else:
-                    self.log_status(f"⚠ No invoice available yet", "warning")
+                    self.log_status("⚠ No invoice available yet", level="warning")
 
             # Shipping label
             if monitor_config.get('download_labels', True):
                 label_path = self.doc_manager.download_shipping_label(order, order_folder)
                 if label_path:
                     documents['label'] = label_path
-                    self.log_status(f"✓ Shipping label downloaded", "success")
+                    self.log_status("✓ Shipping label downloaded", level="success")
                 elif self.wc_client.has_bpost_shipping(order):
-                    self.log_status(f"⚠ No shipping label available yet", "warning")
+                    self.log_status("⚠ No shipping label available yet", level="warning")
 
             # Order details
             details_path = self.doc_manager.create_order_details_file(order, order_folder)
             if details_path:
                 documents['details'] = details_path
-                self.log_status(f"✓ Order details saved", "success")
+                self.log_status("✓ Order details saved", level="success")
 
             # Mark as processed
             self.tracker.mark_processed(order_id, str(order_folder), documents)
 
-            self.log_status(f"✓ Successfully processed order #{order_number}", "success")
+            self.log_status("✓ Successfully processed order #%s", order_number, level="success")
             return True
 
         except Exception as e:
-            self.log_status(f"✗ Error processing order #{order_number}: {e}", "error")
+            self.log_status("✗ Error processing order #%s: %s", order_number, e, level="error")
             return False
 
     def check_orders(self):
         """Check for new orders"""
         try:
-            self.log_status("Checking for new orders...", "info")
+            self.log_status("Checking for new orders...")
 
-            hours = self.config.config['monitoring']['check_orders_since_hours']
-            orders = self.wc_client.get_recent_orders(hours)
+            hours = self.config.mon['check_orders_since_hours']
+            orders = self.wc_client.get_recent_orders(
+                hours, since=self.tracker.last_seen_order_date)
 
             if not orders:
-                self.log_status("No recent orders found", "info")
+                self.log_status("No recent orders found")
                 return
 
-            self.log_status(f"Found {len(orders)} recent orders", "info")
+            self.log_status("Found %d recent orders", len(orders))
+
+            # Filter serially (cheap, in-memory), then process eligible
+            # orders in parallel - each one is dominated by network waits
+            # for the invoice/label downloads.
+            eligible = [
+                order for order in orders
+                if not self.tracker.is_processed(str(order['id']))
+                and self.wc_client.matches_filters(order)
+            ]
 
             processed_count = 0
-            for order in orders:
-                if self.process_order(order):
-                    processed_count += 1
+            failures = 0
+            if eligible:
+                with ThreadPoolExecutor(max_workers=6) as executor:
+                    for processed in executor.map(self.process_order, eligible):
+                        if processed:
+                            processed_count += 1
+                        else:
+                            failures += 1
+                # One tracker write per pass instead of one per order
+                self.tracker.save_tracker()
+
+            # Only advance the watermark on a clean pass, so a failed
+            # order is fetched again next time instead of skipped forever.
+            # The watermark tracks date_modified to match the query floor:
+            # a created-date watermark would skip orders that were still
+            # 'pending' (status-filtered out) when newer orders arrived.
+            if not failures:
+                newest = max((o.get('date_modified', '') for o in orders), default='')
+                if newest:
+                    self.tracker.set_last_seen_order_date(newest)
 
             if processed_count > 0:
-                self.log_status(f"✓ Processed {processed_count} new order(s)", "success")
+                self.log_status("✓ Processed %d new order(s)", processed_count, level="success")
             else:
-                self.log_status("No new orders to process", "info")
+                self.log_status("No new orders to process")
 
         except Exception as e:
-            self.log_status(f"Error checking orders: {e}", "error")
+            self.log_status("Error checking orders: %s", e, level="error")
+
+    @property
+    def running(self) -> bool:
+        """Whether the monitoring loop is active"""
+        return not self._stop_event.is_set()
 
     def start_monitoring(self):
         """Start continuous monitoring"""
-        self.running = True
-        self.log_status("🚀 Monitoring started", "success")
+        self._stop_event.clear()
+        self.log_status("🚀 Monitoring started", level="success")
 
-        while self.running:
+        while not self._stop_event.is_set():
             self.check_orders()
 
-            if self.running:
-                interval = self.config.config['monitoring']['poll_interval']
-                self.log_status(f"Next check in {interval} seconds...", "info")
-
-                for _ in range(interval):
-                    if not self.running:
-                        break
-                    time.sleep(1)
+            if not self._stop_event.is_set():
+                interval = self.config.mon['poll_interval']
+                self.log_status("Next check in %d seconds...", interval)
+                # Single wake-up per cycle; returns immediately on stop
+                self._stop_event.wait(timeout=interval)
 
     def stop_monitoring(self):
         """Stop monitoring"""
-        self.running = False
-        self.log_status("⏹ Monitoring stopped", "warning")
+        self._stop_event.set()
+        self.log_status("⏹ Monitoring stopped", level="warning")
 
 
 # ====================================
 # GUI APPLICATION
 # ====================================
 
+FONT_HEADER = ('Arial', 12, 'bold')
+
+
+def _is_digits(proposed):
+    """validatecommand helper: allow only digits (or empty) in an Entry"""
+    return proposed.isdigit() or proposed == ''
+
+_style_ready = False
+
+
+def _init_style():
+    """Configure the ttk theme once, shared by all windows"""
+    global _style_ready
+    if not _style_ready:
+        ttk.Style().theme_use('clam')
+        _style_ready = True
+
+
 class OrderMonitorGUI:
     """GUI for order monitoring"""
 
@@ -743,36 +950,72 @@ class OrderMonitorGUI:
 
         # Initialize components
         self.config = Config()
-        self.monitor = OrderMonitor(self.config)
-        self.monitor.set_callback(self.update_status)
-        self.monitor_thread = None
-
-        # Setup logging
-        self.setup_logging()
+        self.monitor = None
+        # One long-lived worker pool for all background actions: the
+        # monitoring loop and on-demand checks run here instead of a
+        # fresh thread per click
+        self._executor = ThreadPoolExecutor(max_workers=2,
+                                            thread_name_prefix='monitor')
+        self._check_inflight = False
 
         # Create GUI
         self.create_gui()
 
+        # Heavier setup (log file handle, sqlite tracker, HTTP sessions)
+        # runs once the mainloop starts so the window paints immediately
+        self.root.after(0, self._deferred_init)
+
+        # Coalescing log queue: workers enqueue, the main loop drains in
+        # batches instead of one Tk round-trip per message
+        self._log_q = queue.Queue()
+        self._last_ts_sec = 0
+        self._last_ts_str = ""
+        self.root.after(50, self._drain_log_queue)
+
         # Check configuration
         self.root.after(100, self.check_initial_config)
 
+        # Pool workers are non-daemon, so the process would outlive the
+        # window unless the monitor loop is stopped and the pool shut
+        # down when the user closes it
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        """Stop background work and tear the window down"""
+        if self.monitor is not None:
+            self.monitor.stop_monitoring()
+        # Don't block the UI on a worker that is mid-request; the stop
+        # event ends the loop and the pool drains in the background
+        self._executor.shutdown(wait=False)
+        self.root.destroy()
+
+    def _deferred_init(self):
+        """Construct the monitor and logging after the window is shown"""
+        self.setup_logging()
+        self.monitor = OrderMonitor(self.config)
+        self.monitor.set_callback(self.update_status)
+
     def setup_logging(self):
         """Setup logging configuration"""
-        log_config = self.config.config['logging']
+        log_config = self.config.log
         if log_config['enabled']:
+            # Rotate at 5MB so a long-running monitor can't grow the log
+            # unbounded; delay=True defers opening the file until the
+            # first record. Console output only when attached to a tty.
+            handlers = [RotatingFileHandler(
+                log_config['log_file'], maxBytes=5_000_000,
+                backupCount=3, delay=True)]
+            if sys.stdout is not None and sys.stdout.isatty():
+                handlers.append(logging.StreamHandler())
             logging.basicConfig(
                 level=getattr(logging, log_config['log_level']),
                 format='%(asctime)s - %(levelname)s - %(message)s',
-                handlers=[
-                    logging.FileHandler(log_config['log_file']),
-                    logging.StreamHandler()
-                ]
+                handlers=handlers
             )
 
     def create_gui(self):
         """Create the main GUI"""
-        style = ttk.Style()
-        style.theme_use('clam')
+        _init_style()
 
         # Main container
         main_frame = ttk.Frame(self.root, padding="10")
@@ -787,7 +1030,7 @@ class OrderMonitorGUI:
         header_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
 
         # Status indicator
-        self.status_label = ttk.Label(header_frame, text="⚫ Stopped", font=('Arial', 12, 'bold'))
+        self.status_label = ttk.Label(header_frame, text="⚫ Stopped", font=FONT_HEADER)
         self.status_label.grid(row=0, column=0, sticky=tk.W)
 
         # Control buttons
@@ -815,19 +1058,21 @@ class OrderMonitorGUI:
 
         # Store URL
         ttk.Label(config_frame, text="Store URL:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.url_var = tk.StringVar(value=self.config.config['woocommerce']['url'])
+        self.url_var = tk.StringVar(value=self.config.wc['url'])
         url_entry = ttk.Entry(config_frame, textvariable=self.url_var)
         url_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=5, pady=5)
 
         # Poll interval
         ttk.Label(config_frame, text="Check Interval (seconds):").grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.interval_var = tk.StringVar(value=str(self.config.config['monitoring']['poll_interval']))
-        interval_entry = ttk.Entry(config_frame, textvariable=self.interval_var, width=10)
+        self.interval_var = tk.IntVar(value=self.config.mon['poll_interval'])
+        interval_entry = ttk.Entry(
+            config_frame, textvariable=self.interval_var, width=10,
+            validate='key', validatecommand=(self.root.register(_is_digits), '%P'))
         interval_entry.grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
 
         # Base directory
         ttk.Label(config_frame, text="Save Location:").grid(row=2, column=0, sticky=tk.W, pady=5)
-        self.base_dir_var = tk.StringVar(value=self.config.config['monitoring']['base_directory'])
+        self.base_dir_var = tk.StringVar(value=self.config.mon['base_directory'])
         base_dir_entry = ttk.Entry(config_frame, textvariable=self.base_dir_var)
         base_dir_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), padx=5, pady=5)
         ttk.Button(config_frame, text="Browse", command=self.browse_directory).grid(row=2, column=2, padx=5)
@@ -836,11 +1081,11 @@ class OrderMonitorGUI:
         options_frame = ttk.Frame(config_frame)
         options_frame.grid(row=3, column=1, sticky=tk.W, pady=5)
 
-        self.download_invoices_var = tk.BooleanVar(value=self.config.config['monitoring'].get('download_invoices', True))
+        self.download_invoices_var = tk.BooleanVar(value=self.config.mon.get('download_invoices', True))
         ttk.Checkbutton(options_frame, text="Generate Invoices",
                        variable=self.download_invoices_var).grid(row=0, column=0, padx=5)
 
-        self.download_labels_var = tk.BooleanVar(value=self.config.config['monitoring'].get('download_labels', True))
+        self.download_labels_var = tk.BooleanVar(value=self.config.mon.get('download_labels', True))
         ttk.Checkbutton(options_frame, text="Download Labels",
                        variable=self.download_labels_var).grid(row=0, column=1, padx=5)
 
@@ -872,14 +1117,13 @@ class OrderMonitorGUI:
 
     def browse_directory(self):
         """Browse for save directory"""
-        from tkinter import filedialog
         directory = filedialog.askdirectory(initialdir=self.base_dir_var.get())
         if directory:
             self.base_dir_var.set(directory)
 
     def check_initial_config(self):
         """Check if configuration is complete"""
-        wc_config = self.config.config['woocommerce']
+        wc_config = self.config.wc
         if not wc_config['consumer_key'] or not wc_config['consumer_secret']:
             if messagebox.askyesno("Configuration Required",
                                    "WooCommerce API credentials not configured.\n\n"
@@ -890,20 +1134,64 @@ class OrderMonitorGUI:
         """Open settings dialog"""
         SettingsDialog(self.root, self.config)
 
+    _LOG_MAX_LINES = 2000
+
     def update_status(self, message: str, level: str = "info"):
-        """Update status in GUI"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_message = f"[{timestamp}] {message}\n"
+        """Queue a status update (callable from worker threads)"""
+        self._log_q.put_nowait((time.time(), message, level))
 
-        self.log_text.insert(tk.END, log_message, level)
-        self.log_text.see(tk.END)
+    def _drain_log_queue(self):
+        """Flush queued log lines into the Text widget in batches
+
+        A burst of worker messages becomes one insert per run of
+        same-level lines plus a single scroll and stats refresh, instead
+        of three Tk operations per message.
+        """
+        try:
+            entries = []
+            while len(entries) < 500:
+                try:
+                    entries.append(self._log_q.get_nowait())
+                except queue.Empty:
+                    break
 
-        # Update stats
-        processed_count = len(self.monitor.tracker.processed_orders)
-        self.stats_label.config(text=f"Processed orders: {processed_count}")
+            if entries:
+                group = []
+                group_level = entries[0][2]
+                for ts, message, level in entries:
+                    # Lines land at 50ms granularity, so the formatted
+                    # second rarely changes between them
+                    sec = int(ts)
+                    if sec != self._last_ts_sec:
+                        self._last_ts_str = time.strftime(
+                            "%H:%M:%S", time.localtime(sec))
+                        self._last_ts_sec = sec
+                    if level != group_level:
+                        self.log_text.insert(tk.END, ''.join(group), group_level)
+                        group = []
+                        group_level = level
+                    group.append(f"[{self._last_ts_str}] {message}\n")
+                self.log_text.insert(tk.END, ''.join(group), group_level)
+
+                # Keep the widget bounded for long-running sessions
+                lines = int(self.log_text.index('end-1c').split('.')[0])
+                if lines > self._LOG_MAX_LINES:
+                    self.log_text.delete('1.0', f'{lines - self._LOG_MAX_LINES + 1}.0')
+
+                # Don't yank the view to the bottom if the user has
+                # scrolled up to read older lines
+                if self.log_text.yview()[1] > 0.99:
+                    self.log_text.see(tk.END)
+                if self.monitor:
+                    processed_count = self.monitor.tracker.count()
+                    self.stats_label.config(text=f"Processed orders: {processed_count}")
+        finally:
+            self.root.after(50, self._drain_log_queue)
 
     def start_monitoring(self):
         """Start monitoring in background thread"""
+        if self.monitor is None:
+            return
         self.save_current_config()
 
         # Test connection
@@ -924,9 +1212,8 @@ class OrderMonitorGUI:
         self.stop_button.config(state=tk.NORMAL)
         self.check_now_button.config(state=tk.DISABLED)
 
-        # Start monitoring thread
-        self.monitor_thread = threading.Thread(target=self.monitor.start_monitoring, daemon=True)
-        self.monitor_thread.start()
+        # Run the monitoring loop on the shared worker pool
+        self._executor.submit(self.monitor.start_monitoring)
 
     def stop_monitoring(self):
         """Stop monitoring"""
@@ -940,18 +1227,45 @@ class OrderMonitorGUI:
 
     def check_now(self):
         """Check for orders immediately"""
+        if self.monitor is None or self._check_inflight:
+            return
         self.save_current_config()
-        threading.Thread(target=self.monitor.check_orders, daemon=True).start()
+        self._check_inflight = True
+        self.check_now_button.config(state=tk.DISABLED)
+        future = self._executor.submit(self.monitor.check_orders)
+        future.add_done_callback(
+            lambda _f: self.root.after(0, self._check_done))
+
+    def _check_done(self):
+        """Re-enable Check Now once the in-flight check finishes"""
+        self._check_inflight = False
+        # Leave the button disabled while continuous monitoring owns it
+        if self.monitor and not self.monitor.running:
+            self.check_now_button.config(state=tk.NORMAL)
 
     def save_current_config(self):
         """Save current configuration from GUI"""
         try:
-            self.config.config['woocommerce']['url'] = self.url_var.get()
-            self.config.config['monitoring']['poll_interval'] = int(self.interval_var.get())
-            self.config.config['monitoring']['base_directory'] = self.base_dir_var.get()
-            self.config.config['monitoring']['download_invoices'] = self.download_invoices_var.get()
-            self.config.config['monitoring']['download_labels'] = self.download_labels_var.get()
-            self.config.save_config()
+            wc_config = self.config.wc
+            monitor_config = self.config.mon
+            updates = (
+                (wc_config, 'url', self.url_var.get()),
+                (monitor_config, 'poll_interval', self.interval_var.get()),
+                (monitor_config, 'base_directory', self.base_dir_var.get()),
+                (monitor_config, 'download_invoices', self.download_invoices_var.get()),
+                (monitor_config, 'download_labels', self.download_labels_var.get()),
+            )
+
+            # Only rewrite the file when a value actually changed; this
+            # runs on every Start / Check Now click
+            changed = False
+            for section, key, value in updates:
+                if section.get(key) != value:
+                    section[key] = value
+                    changed = True
+
+            if changed:
+                self.config.save_config()
         except Exception as e:
             self.update_status(f"Error saving config: {e}", "error")
 
@@ -975,6 +1289,7 @@ class SettingsDialog:
 
     def create_dialog(self):
         """Create settings dialog"""
+        _init_style()
         notebook = ttk.Notebook(self.dialog)
         notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
@@ -982,7 +1297,7 @@ class SettingsDialog:
         wc_frame = ttk.Frame(notebook, padding="10")
         notebook.add(wc_frame, text="WooCommerce API")
 
-        wc_config = self.config.config['woocommerce']
+        wc_config = self.config.wc
 
         ttk.Label(wc_frame, text="Consumer Key:").grid(row=0, column=0, sticky=tk.W, pady=5)
         self.consumer_key_var = tk.StringVar(value=wc_config['consumer_key'])
@@ -1015,17 +1330,20 @@ class SettingsDialog:
         monitor_frame = ttk.Frame(notebook, padding="10")
         notebook.add(monitor_frame, text="Monitoring")
 
-        monitor_config = self.config.config['monitoring']
+        monitor_config = self.config.mon
 
         ttk.Label(monitor_frame, text="Check orders from last (hours):").grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.check_hours_var = tk.StringVar(value=str(monitor_config['check_orders_since_hours']))
-        ttk.Entry(monitor_frame, textvariable=self.check_hours_var, width=10).grid(row=0, column=1, sticky=tk.W, pady=5)
+        self.check_hours_var = tk.IntVar(value=monitor_config['check_orders_since_hours'])
+        ttk.Entry(monitor_frame, textvariable=self.check_hours_var, width=10,
+                  validate='key',
+                  validatecommand=(self.dialog.register(_is_digits), '%P')
+                  ).grid(row=0, column=1, sticky=tk.W, pady=5)
 
         # Filters tab
         filter_frame = ttk.Frame(notebook, padding="10")
         notebook.add(filter_frame, text="Filters")
 
-        filters = self.config.config['filters']
+        filters = self.config.filters
 
         ttk.Label(filter_frame, text="Order Statuses (comma-separated):").grid(row=0, column=0, sticky=tk.W, pady=5)
         self.statuses_var = tk.StringVar(value=','.join(filters.get('order_statuses', [])))
@@ -1043,13 +1361,13 @@ class SettingsDialog:
     def save_settings(self):
         """Save settings"""
         try:
-            self.config.config['woocommerce']['consumer_key'] = self.consumer_key_var.get()
-            self.config.config['woocommerce']['consumer_secret'] = self.consumer_secret_var.get()
-            self.config.config['woocommerce']['monitor_secret_key'] = self.monitor_secret_var.get()
-            self.config.config['monitoring']['check_orders_since_hours'] = int(self.check_hours_var.get())
+            self.config.wc['consumer_key'] = self.consumer_key_var.get()
+            self.config.wc['consumer_secret'] = self.consumer_secret_var.get()
+            self.config.wc['monitor_secret_key'] = self.monitor_secret_var.get()
+            self.config.mon['check_orders_since_hours'] = self.check_hours_var.get()
 
             statuses = [s.strip() for s in self.statuses_var.get().split(',') if s.strip()]
-            self.config.config['filters']['order_statuses'] = statuses
+            self.config.filters['order_statuses'] = statuses
 
             if self.config.save_config():
                 messagebox.showinfo("Success", "Settings saved successfully!")
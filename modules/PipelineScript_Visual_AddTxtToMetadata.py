@@ -1,396 +1,692 @@
-import os
-import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
-from PIL import Image as PilImage
-import pyexiv2
-import threading
-import queue
-
-class ImageMetadataApp:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("Image Metadata Tool")
-        self.root.geometry("750x650")
-        self.root.minsize(700, 550)
-        
-        # Queue for thread communication
-        self.queue = queue.Queue()
-        
-        # Configure main window
-        self.root.columnconfigure(0, weight=1)
-        self.root.rowconfigure(1, weight=1)
-        
-        # Create header
-        header_frame = tk.Frame(self.root, bg="#2c3e50", height=60)
-        header_frame.grid(row=0, column=0, sticky="ew", padx=0, pady=0)
-        header_frame.grid_propagate(False)
-        
-        # Add title to header
-        title_label = tk.Label(header_frame, text="Image Metadata Tool", 
-                              font=("Arial", 16, "bold"), fg="white", bg="#2c3e50")
-        title_label.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
-        
-        # Create main frame
-        main_frame = ttk.Frame(self.root)
-        main_frame.grid(row=1, column=0, sticky="nsew", padx=10, pady=10)
-        main_frame.columnconfigure(0, weight=1)
-        main_frame.columnconfigure(1, weight=2)  # Give more weight to preview/log
-        main_frame.rowconfigure(0, weight=1)
-        
-        # Create settings panel (left side)
-        form_frame = ttk.LabelFrame(main_frame, text="Settings")
-        form_frame.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
-        
-        # Image directory
-        ttk.Label(form_frame, text="Image Directory:").grid(row=0, column=0, sticky="w", padx=10, pady=10)
-        self.image_dir_var = tk.StringVar()
-        image_dir_entry = ttk.Entry(form_frame, textvariable=self.image_dir_var, width=40)
-        image_dir_entry.grid(row=0, column=1, sticky="ew", padx=5, pady=10)
-        ttk.Button(form_frame, text="Browse", command=self.browse_image_dir).grid(row=0, column=2, padx=5, pady=10)
-        
-        # Destination directory
-        ttk.Label(form_frame, text="Destination Directory:").grid(row=1, column=0, sticky="w", padx=10, pady=10)
-        self.dest_dir_var = tk.StringVar()
-        dest_dir_entry = ttk.Entry(form_frame, textvariable=self.dest_dir_var, width=40)
-        dest_dir_entry.grid(row=1, column=1, sticky="ew", padx=5, pady=10)
-        ttk.Button(form_frame, text="Browse", command=self.browse_dest_dir).grid(row=1, column=2, padx=5, pady=10)
-        
-        # Same as source directory option
-        self.same_dir_var = tk.BooleanVar(value=False)
-        ttk.Checkbutton(form_frame, text="Same as Source Directory", 
-                      variable=self.same_dir_var, command=self.toggle_dest_dir).grid(row=2, column=0, columnspan=3, sticky="w", padx=10, pady=(0, 10))
-        
-        # Options frame
-        options_frame = ttk.LabelFrame(form_frame, text="Options")
-        options_frame.grid(row=3, column=0, columnspan=3, sticky="ew", padx=5, pady=10)
-        
-        # Process subdirectories option
-        self.process_subdirs_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(options_frame, text="Process Subdirectories", 
-                      variable=self.process_subdirs_var).grid(row=0, column=0, sticky="w", padx=10, pady=5)
-        
-        # Delete text files option
-        self.delete_txt_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(options_frame, text="Delete Text Files After Processing", 
-                      variable=self.delete_txt_var).grid(row=1, column=0, sticky="w", padx=10, pady=5)
-        
-        # Convert non-JPEG images option
-        self.convert_images_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(options_frame, text="Convert Non-JPEG Images to JPG", 
-                      variable=self.convert_images_var).grid(row=2, column=0, sticky="w", padx=10, pady=5)
-        
-        # Delete original images after conversion option
-        self.delete_originals_var = tk.BooleanVar(value=False)
-        ttk.Checkbutton(options_frame, text="Delete Original Images After Conversion", 
-                      variable=self.delete_originals_var).grid(row=3, column=0, sticky="w", padx=10, pady=5)
-        
-        # Create Process button
-        process_btn = ttk.Button(form_frame, text="Process Images", 
-                               command=self.start_processing, padding=(20, 10))
-        process_btn.grid(row=4, column=0, columnspan=3, pady=20)
-        
-        # Create log panel (right side)
-        log_frame = ttk.LabelFrame(main_frame, text="Processing Log")
-        log_frame.grid(row=0, column=1, sticky="nsew", padx=5, pady=5)
-        log_frame.rowconfigure(0, weight=1)
-        log_frame.columnconfigure(0, weight=1)
-        
-        # Log text widget with scrollbar
-        self.log_scrollbar = ttk.Scrollbar(log_frame)
-        self.log_scrollbar.grid(row=0, column=1, sticky="ns")
-        
-        self.log_text = tk.Text(log_frame, wrap=tk.WORD, 
-                               yscrollcommand=self.log_scrollbar.set,
-                               background="#f8f8f8")
-        self.log_text.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
-        self.log_scrollbar.config(command=self.log_text.yview)
-        
-        # Status bar
-        self.status_var = tk.StringVar()
-        self.status_var.set("Ready")
-        self.status_bar = tk.Label(self.root, textvariable=self.status_var, bd=1, 
-                                  relief=tk.SUNKEN, anchor=tk.W)
-        self.status_bar.grid(row=2, column=0, sticky="ew")
-        
-        # Progress bar
-        self.progress_bar = ttk.Progressbar(self.root, orient="horizontal", 
-                                         length=100, mode="determinate")
-        self.progress_bar.grid(row=3, column=0, sticky="ew", padx=10, pady=5)
-        
-        # Set up periodic checks for the queue
-        self.root.after(100, self.check_queue)
-    
-    def browse_image_dir(self):
-        """Open dialog to browse for image directory"""
-        directory = filedialog.askdirectory()
-        if directory:
-            self.image_dir_var.set(directory)
-            # If "Same as Source Directory" is checked, update destination directory too
-            if self.same_dir_var.get():
-                self.dest_dir_var.set(directory)
-    
-    def browse_dest_dir(self):
-        """Open dialog to browse for destination directory"""
-        directory = filedialog.askdirectory()
-        if directory:
-            self.dest_dir_var.set(directory)
-    
-    def toggle_dest_dir(self):
-        """Toggle destination directory based on checkbox"""
-        if self.same_dir_var.get():
-            # Use source directory as destination
-            self.dest_dir_var.set(self.image_dir_var.get())
-            # Disable destination directory entry
-            for widget in self.root.winfo_children():
-                if isinstance(widget, ttk.Entry) and widget.cget("textvariable") == str(self.dest_dir_var):
-                    widget.configure(state="disabled")
-        else:
-            # Enable destination directory entry
-            for widget in self.root.winfo_children():
-                if isinstance(widget, ttk.Entry) and widget.cget("textvariable") == str(self.dest_dir_var):
-                    widget.configure(state="normal")
-    
-    def log_message(self, message):
-        """Add a message to the log"""
-        self.queue.put(("log", message))
-    
-    def update_status(self, message):
-        """Update the status bar message"""
-        self.queue.put(("status", message))
-    
-    def update_progress(self, value):
-        """Update the progress bar value"""
-        self.queue.put(("progress", value))
-    
-    def check_queue(self):
-        """Check the queue for messages from the worker thread"""
-        try:
-            while True:
-                message_type, message = self.queue.get_nowait()
-                
-                if message_type == "log":
-                    self.log_text.insert(tk.END, message + "\n")
-                    self.log_text.see(tk.END)  # Scroll to the end
-                elif message_type == "status":
-                    self.status_var.set(message)
-                elif message_type == "progress":
-                    self.progress_bar["value"] = message
-                elif message_type == "done":
-                    messagebox.showinfo("Complete", message)
-                    self.progress_bar["value"] = 0
-                    self.status_var.set("Ready")
-                
-                self.queue.task_done()
-        except queue.Empty:
-            # No more messages, schedule another check
-            self.root.after(100, self.check_queue)
-    
-    def start_processing(self):
-        """Start processing images in a separate thread"""
-        # Get the image directory
-        image_directory = self.image_dir_var.get()
-        
-        if not image_directory or not os.path.isdir(image_directory):
-            messagebox.showerror("Error", "Please select a valid image directory.")
-            return
-        
-        # Get destination directory
-        if self.same_dir_var.get():
-            dest_directory = image_directory
-        else:
-            dest_directory = self.dest_dir_var.get()
-            if not dest_directory:
-                messagebox.showerror("Error", "Please select a destination directory.")
-                return
-            
-            # Create destination directory if it doesn't exist
-            if not os.path.exists(dest_directory):
-                try:
-                    os.makedirs(dest_directory)
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to create destination directory: {e}")
-                    return
-        
-        # Clear the log
-        self.log_text.delete(1.0, tk.END)
-        
-        # Get options
-        process_subdirs = self.process_subdirs_var.get()
-        delete_txt = self.delete_txt_var.get()
-        convert_images = self.convert_images_var.get()
-        delete_originals = self.delete_originals_var.get()
-        
-        # Start processing in a separate thread
-        self.processing_thread = threading.Thread(
-            target=self.process_images,
-            args=(image_directory, dest_directory, process_subdirs, delete_txt, convert_images, delete_originals)
-        )
-        self.processing_thread.daemon = True
-        self.processing_thread.start()
-        
-        self.update_status("Processing images...")
-    
-    def process_images(self, image_folder, dest_folder, process_subdirs, delete_txt, convert_images, delete_originals):
-        """Process images and add metadata from text files"""
-        try:
-            # Define supported image formats
-            jpeg_formats = ['.jpg', '.jpeg']
-            convertible_formats = ['.png', '.webp', '.bmp', '.tiff', '.tif', '.gif']
-            supported_formats = jpeg_formats + (convertible_formats if convert_images else [])
-            
-            # Get all image files
-            all_files = []
-            total_processed = 0
-            
-            if process_subdirs:
-                for root, dirs, files in os.walk(image_folder):
-                    for file in files:
-                        file_lower = file.lower()
-                        if any(file_lower.endswith(ext) for ext in supported_formats):
-                            all_files.append(os.path.join(root, file))
-            else:
-                for file in os.listdir(image_folder):
-                    file_lower = file.lower()
-                    if any(file_lower.endswith(ext) for ext in supported_formats):
-                        all_files.append(os.path.join(image_folder, file))
-            
-            if not all_files:
-                self.log_message("No supported image files found in the selected directory.")
-                self.update_status("No images found")
-                self.queue.put(("done", "No images found"))
-                return
-            
-            self.log_message(f"Found {len(all_files)} image files")
-            
-            # Process each image
-            for i, image_path in enumerate(all_files):
-                try:
-                    # Update progress
-                    progress = int((i / len(all_files)) * 100)
-                    self.update_progress(progress)
-                    
-                    self.log_message(f"Processing {image_path}")
-                    
-                    # Get file extension and name
-                    file_ext = os.path.splitext(image_path)[1].lower()
-                    file_name = os.path.basename(image_path)
-                    base_name = os.path.splitext(file_name)[0]
-                    
-                    # Create relative path structure if needed
-                    if image_folder != dest_folder and process_subdirs:
-                        # Get the relative path from source folder
-                        rel_path = os.path.dirname(os.path.relpath(image_path, image_folder))
-                        target_dir = os.path.join(dest_folder, rel_path)
-                        
-                        # Create the directory structure in destination
-                        if not os.path.exists(target_dir):
-                            os.makedirs(target_dir)
-                    else:
-                        target_dir = dest_folder
-                    
-                    # Determine if this is a JPEG or needs conversion
-                    needs_conversion = file_ext not in jpeg_formats and convert_images
-                    
-                    # Prepare target path
-                    if needs_conversion:
-                        target_path = os.path.join(target_dir, base_name + '.jpg')
-                    else:
-                        target_path = os.path.join(target_dir, file_name)
-                    
-                    # Copy or convert the image
-                    if image_folder == dest_folder and not needs_conversion:
-                        # No need to copy, use the original path
-                        metadata_target = image_path
-                    else:
-                        if needs_conversion:
-                            try:
-                                self.log_message(f"Converting {file_ext} to JPEG: {image_path}")
-                                
-                                # Open and convert image to JPEG
-                                image = PilImage.open(image_path)
-                                rgb_image = image.convert('RGB')
-                                rgb_image.save(target_path, 'JPEG')
-                                
-                                # Use the new JPEG path for metadata
-                                metadata_target = target_path
-                            except Exception as e:
-                                self.log_message(f"Error converting image: {str(e)}")
-                                # Skip to next file if conversion failed
-                                continue
-                        else:
-                            # Copy the JPEG file to destination
-                            import shutil
-                            shutil.copy2(image_path, target_path)
-                            metadata_target = target_path
-                    
-                    # Check for corresponding text file
-                    text_file_path = os.path.splitext(image_path)[0] + '.txt'
-                    
-                    # Get caption from text file if it exists
-                    caption_text = ""
-                    if os.path.exists(text_file_path):
-                        with open(text_file_path, 'r', encoding='utf-8') as file:
-                            caption_text = file.read().strip()
-                        self.log_message(f"Found text file: {text_file_path}")
-                        
-                        # Add metadata to the image if text file exists and has content
-                        if caption_text:
-                            self.add_metadata_to_image(metadata_target, caption_text)
-                            total_processed += 1
-                        
-                        # Delete the text file if requested
-                        if delete_txt:
-                            os.remove(text_file_path)
-                            self.log_message(f"Deleted text file: {text_file_path}")
-                    
-                    # Delete original if requested and we're not already in the same directory
-                    if delete_originals and needs_conversion and os.path.exists(image_path):
-                        os.remove(image_path)
-                        self.log_message(f"Deleted original image: {image_path}")
-                
-                except Exception as e:
-                    self.log_message(f"Error processing {image_path}: {str(e)}")
-            
-            # Final update
-            self.update_progress(100)
-            message = f"Completed! Processed {total_processed} images."
-            self.log_message(message)
-            self.queue.put(("done", message))
-            
-        except Exception as e:
-            error_message = f"Error during processing: {str(e)}"
-            self.log_message(error_message)
-            self.queue.put(("done", error_message))
-    
-    def add_metadata_to_image(self, image_path, metadata_text):
-        """Add metadata to an image file using pyexiv2"""
-        try:
-            # Open the image with pyexiv2
-            image = pyexiv2.Image(image_path)
-            
-            # Create metadata dictionary
-            metadata = {}
-            
-            # Add caption to metadata fields
-            if metadata_text:
-                metadata['Exif.Image.ImageDescription'] = metadata_text
-                metadata['Exif.Photo.UserComment'] = metadata_text
-            
-            # Write metadata to the image
-            image.modify_exif(metadata)
-            
-            # Close the image
-            image.close()
-            
-            self.log_message(f"Added metadata to: {image_path}")
-            return True
-            
-        except Exception as e:
-            self.log_message(f"Error adding metadata to {image_path}: {str(e)}")
-            return False
-
-# Run the application
-if __name__ == "__main__":
-    root = tk.Tk()
-    app = ImageMetadataApp(root)
+import os
+import shutil
+import sys
+import tkinter as tk
+from tkinter import filedialog, messagebox, ttk
+from concurrent.futures import (ProcessPoolExecutor, wait,
+                                FIRST_COMPLETED)
+from functools import lru_cache, partial
+from PIL import Image as PilImage
+import pyexiv2
+
+# piexif patches just the EXIF APP1 segment of a JPEG, which is far
+# cheaper than a full libexiv2 parse; fall back to pyexiv2 without it
+try:
+    import piexif
+except ImportError:
+    piexif = None
+import threading
+import time
+from collections import deque
+
+# Image formats handled by the processing pipeline
+JPEG_FORMATS = ('.jpg', '.jpeg')
+CONVERTIBLE_FORMATS = ('.png', '.webp', '.bmp', '.tiff', '.tif', '.gif')
+
+if sys.platform == 'linux':
+    import fcntl
+
+    _FICLONE = 0x40049409  # ioctl: clone file extents (reflink)
+
+    def _fast_copy(src, dst):
+        """Copy src to dst with in-kernel data movement.
+
+        Tries a reflink clone first (free on btrfs/XFS), then falls back
+        to sendfile in 1MiB chunks, so the bytes never pass through a
+        Python-level read/write loop. Metadata is preserved as with
+        shutil.copy2.
+        """
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            infd = fsrc.fileno()
+            outfd = fdst.fileno()
+            try:
+                fcntl.ioctl(outfd, _FICLONE, infd)
+            except OSError:
+                offset = 0
+                while True:
+                    sent = os.sendfile(outfd, infd, offset, 1 << 20)
+                    if sent == 0:
+                        break
+                    offset += sent
+        shutil.copystat(src, dst)
+else:
+    _fast_copy = shutil.copy2
+
+
+def _iter_images(root_dir, exts, recurse):
+    """Yield (path, ext) for supported images under root_dir.
+
+    An iterative os.scandir walk keeps the file-type information that
+    came with the directory read, so classifying each entry needs no
+    extra stat call, and extension matching is one frozenset lookup.
+    """
+    stack = [root_dir]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recurse:
+                        stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    ext = os.path.splitext(entry.name)[1].lower()
+                    if ext in exts:
+                        yield entry.path, ext
+
+
+@lru_cache(maxsize=128)
+def _caption_exif_bytes(metadata_text):
+    """Build the EXIF APP1 payload for a caption (requires piexif)
+
+    Cached per worker process: training-style datasets often share one
+    caption across many images, so the dump runs once per distinct text.
+    """
+    exif_dict = {
+        "0th": {piexif.ImageIFD.ImageDescription:
+                metadata_text.encode('utf-8')},
+        "Exif": {piexif.ExifIFD.UserComment:
+                 b"UNICODE\0" + metadata_text.encode('utf-16-be')},
+    }
+    return piexif.dump(exif_dict)
+
+
+def _read_small_text(path, limit=65536):
+    """Read a small UTF-8 text file with one read syscall.
+
+    Caption sidecars are tiny, so the open/read/close of a buffered
+    TextIOWrapper (extra stat, buffer allocation, codec machinery) is
+    mostly overhead. Falls back to chunked reads for the rare file
+    larger than the limit.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, limit)
+        if len(data) == limit:
+            chunks = [data]
+            while True:
+                chunk = os.read(fd, limit)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            data = b"".join(chunks)
+    finally:
+        os.close(fd)
+    return data.decode('utf-8', errors='replace').strip()
+
+
+def _add_metadata(image_path, metadata_text):
+    """Add caption metadata to an image file.
+
+    Runs in worker processes; returns (ok, log_line). JPEG targets get
+    their APP1 segment patched in place with piexif when available;
+    anything else (or a piexif failure) goes through pyexiv2, which
+    parses the whole file.
+    """
+    if piexif is not None and image_path.lower().endswith(JPEG_FORMATS):
+        try:
+            # Skip the rewrite entirely when the file already carries this
+            # caption — re-runs over an existing destination become no-ops
+            existing = piexif.load(image_path)
+            current = existing.get("0th", {}).get(
+                piexif.ImageIFD.ImageDescription, b'')
+            if current.decode('utf-8', errors='replace') == metadata_text:
+                return True, f"Metadata already current: {image_path}"
+            # Merge the caption into the loaded EXIF rather than writing
+            # a fresh segment, so orientation, camera fields, GPS and the
+            # thumbnail survive the patch (as they did under modify_exif)
+            existing.setdefault("0th", {})[
+                piexif.ImageIFD.ImageDescription] = metadata_text.encode('utf-8')
+            existing.setdefault("Exif", {})[
+                piexif.ExifIFD.UserComment] = (
+                    b"UNICODE\0" + metadata_text.encode('utf-16-be'))
+            piexif.insert(piexif.dump(existing), image_path)
+            return True, f"Added metadata to: {image_path}"
+        except Exception:
+            pass  # fall through to the pyexiv2 path
+
+    try:
+        # Open the image with pyexiv2
+        image = pyexiv2.Image(image_path)
+
+        # Add caption to metadata fields
+        metadata = {
+            'Exif.Image.ImageDescription': metadata_text,
+            'Exif.Photo.UserComment': metadata_text
+        }
+
+        # Write metadata to the image
+        image.modify_exif(metadata)
+        image.close()
+
+        return True, f"Added metadata to: {image_path}"
+    except Exception as e:
+        return False, f"Error adding metadata to {image_path}: {str(e)}"
+
+
+# Destination directories already created by this worker process
+_created_dirs = set()
+
+
+def _process_one(item, image_folder, dest_folder, process_subdirs,
+                 delete_txt, convert_images, delete_originals,
+                 skip_no_caption=False, max_size=0):
+    """Process a single image; runs in a worker process.
+
+    item is a (path, ext) pair from _iter_images. Each file is
+    independent (PIL decode/encode and the pyexiv2 write), so the GUI
+    fans these out across cores. Returns (log_lines, processed, unlinks)
+    where processed is True when a caption was written and unlinks lists
+    files to delete - removals are batched by the parent so the hot loop
+    stays free of metadata syscalls.
+    """
+    image_path, file_ext = item
+    log_lines = []
+    processed = False
+    unlinks = []
+    try:
+        log_lines.append(f"Processing {image_path}")
+
+        # Split the path once instead of repeated basename/splitext calls;
+        # the extension length is known from discovery
+        dir_part, _, file_name = image_path.rpartition(os.sep)
+        base_name = file_name[:-len(file_ext)]
+
+        # Create relative path structure if needed
+        if image_folder != dest_folder and process_subdirs:
+            # Relative directory under the source folder, via one slice
+            rel_path = image_path[len(image_folder.rstrip(os.sep)) + 1:]
+            rel_path = rel_path.rpartition(os.sep)[0]
+            target_dir = os.path.join(dest_folder, rel_path)
+
+            # Create the directory structure in destination; the cache
+            # skips both syscalls for directories this process has seen
+            if target_dir not in _created_dirs:
+                os.makedirs(target_dir, exist_ok=True)
+                _created_dirs.add(target_dir)
+        else:
+            target_dir = dest_folder
+
+        # Determine if this is a JPEG or needs conversion
+        needs_conversion = file_ext not in JPEG_FORMATS and convert_images
+        if max_size and image_folder != dest_folder:
+            # Resizing always goes through a decode/encode, even for
+            # JPEGs that would otherwise just be copied. In-place runs
+            # are left alone so originals are never overwritten smaller.
+            needs_conversion = True
+
+        # Read the caption sidecar up front so conversions can embed the
+        # EXIF during the encode instead of rewriting the JPEG afterwards
+        text_file_path = dir_part + os.sep + base_name + '.txt'
+        caption_text = ""
+        have_txt = os.path.exists(text_file_path)
+        if have_txt:
+            caption_text = _read_small_text(text_file_path)
+            log_lines.append(f"Found text file: {text_file_path}")
+        elif skip_no_caption:
+            # The whole copy/convert would be wasted work
+            log_lines.append(f"No caption file, skipping: {image_path}")
+            return log_lines, processed, unlinks
+
+        # Prepare target path
+        if needs_conversion:
+            target_path = os.path.join(target_dir, base_name + '.jpg')
+        else:
+            target_path = os.path.join(target_dir, file_name)
+
+        # Copy or convert the image
+        if image_folder == dest_folder and not needs_conversion:
+            # No need to copy, use the original path
+            metadata_target = image_path
+        else:
+            if needs_conversion:
+                try:
+                    log_lines.append(f"Converting {file_ext} to JPEG: {image_path}")
+
+                    # Inject the caption during the encode when we can,
+                    # saving a reopen-and-rewrite of the fresh JPEG
+                    save_kwargs = {'quality': 90}
+                    if caption_text and piexif is not None:
+                        save_kwargs['exif'] = _caption_exif_bytes(caption_text)
+
+                    # Open and convert image to JPEG. draft() lets
+                    # JPEG sources decode straight to RGB - and when a
+                    # max size is set, libjpeg decodes at a reduced DCT
+                    # scale so the full-resolution pixels never exist in
+                    # memory. thumbnail() then finishes the exact resize.
+                    with PilImage.open(image_path) as image:
+                        if max_size:
+                            image.draft('RGB', (max_size, max_size))
+                        else:
+                            image.draft('RGB', image.size)
+                        image = image.convert('RGB')
+                        if max_size:
+                            image.thumbnail((max_size, max_size))
+                        image.save(target_path, 'JPEG', **save_kwargs)
+
+                    if 'exif' in save_kwargs:
+                        processed = True
+                        caption_text = ""  # already embedded
+                        log_lines.append(f"Added metadata to: {target_path}")
+
+                    # Use the new JPEG path for metadata
+                    metadata_target = target_path
+                except Exception as e:
+                    log_lines.append(f"Error converting image: {str(e)}")
+                    # Skip the rest if conversion failed
+                    return log_lines, processed, unlinks
+            else:
+                # Copy the JPEG file to destination
+                _fast_copy(image_path, target_path)
+                metadata_target = target_path
+
+        # Add metadata to the image if it wasn't embedded during encode
+        if caption_text:
+            processed, meta_line = _add_metadata(metadata_target, caption_text)
+            log_lines.append(meta_line)
+
+        # Queue the text file for deletion if requested
+        if have_txt and delete_txt:
+            unlinks.append(text_file_path)
+            log_lines.append(f"Deleting text file: {text_file_path}")
+
+        # Queue the original if requested and it was converted
+        if delete_originals and needs_conversion:
+            unlinks.append(image_path)
+            log_lines.append(f"Deleting original image: {image_path}")
+
+    except Exception as e:
+        log_lines.append(f"Error processing {image_path}: {str(e)}")
+
+    return log_lines, processed, unlinks
+
+
+class ImageMetadataApp:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Image Metadata Tool")
+        self.root.geometry("750x650")
+        self.root.minsize(700, 550)
+        
+        # Message channel for thread communication. A deque's
+        # append/popleft are atomic in CPython, so the single-producer /
+        # single-consumer hand-off needs no lock at all
+        self.msgs = deque()
+        
+        # Configure main window
+        self.root.columnconfigure(0, weight=1)
+        self.root.rowconfigure(1, weight=1)
+        
+        # Create header
+        header_frame = tk.Frame(self.root, bg="#2c3e50", height=60)
+        header_frame.grid(row=0, column=0, sticky="ew", padx=0, pady=0)
+        header_frame.grid_propagate(False)
+        
+        # Add title to header
+        title_label = tk.Label(header_frame, text="Image Metadata Tool", 
+                              font=("Arial", 16, "bold"), fg="white", bg="#2c3e50")
+        title_label.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+        
+        # Create main frame
+        main_frame = ttk.Frame(self.root)
+        main_frame.grid(row=1, column=0, sticky="nsew", padx=10, pady=10)
+        main_frame.columnconfigure(0, weight=1)
+        main_frame.columnconfigure(1, weight=2)  # Give more weight to preview/log
+        main_frame.rowconfigure(0, weight=1)
+        
+        # Create settings panel (left side)
+        form_frame = ttk.LabelFrame(main_frame, text="Settings")
+        form_frame.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
+        
+        # Image directory
+        ttk.Label(form_frame, text="Image Directory:").grid(row=0, column=0, sticky="w", padx=10, pady=10)
+        self.image_dir_var = tk.StringVar()
+        image_dir_entry = ttk.Entry(form_frame, textvariable=self.image_dir_var, width=40)
+        image_dir_entry.grid(row=0, column=1, sticky="ew", padx=5, pady=10)
+        ttk.Button(form_frame, text="Browse", command=self.browse_image_dir).grid(row=0, column=2, padx=5, pady=10)
+        
+        # Destination directory
+        ttk.Label(form_frame, text="Destination Directory:").grid(row=1, column=0, sticky="w", padx=10, pady=10)
+        self.dest_dir_var = tk.StringVar()
+        dest_dir_entry = ttk.Entry(form_frame, textvariable=self.dest_dir_var, width=40)
+        dest_dir_entry.grid(row=1, column=1, sticky="ew", padx=5, pady=10)
+        ttk.Button(form_frame, text="Browse", command=self.browse_dest_dir).grid(row=1, column=2, padx=5, pady=10)
+        
+        # Same as source directory option
+        self.same_dir_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(form_frame, text="Same as Source Directory", 
+                      variable=self.same_dir_var, command=self.toggle_dest_dir).grid(row=2, column=0, columnspan=3, sticky="w", padx=10, pady=(0, 10))
+        
+        # Options frame
+        options_frame = ttk.LabelFrame(form_frame, text="Options")
+        options_frame.grid(row=3, column=0, columnspan=3, sticky="ew", padx=5, pady=10)
+        
+        # Process subdirectories option
+        self.process_subdirs_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(options_frame, text="Process Subdirectories", 
+                      variable=self.process_subdirs_var).grid(row=0, column=0, sticky="w", padx=10, pady=5)
+        
+        # Delete text files option
+        self.delete_txt_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(options_frame, text="Delete Text Files After Processing", 
+                      variable=self.delete_txt_var).grid(row=1, column=0, sticky="w", padx=10, pady=5)
+        
+        # Convert non-JPEG images option
+        self.convert_images_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(options_frame, text="Convert Non-JPEG Images to JPG", 
+                      variable=self.convert_images_var).grid(row=2, column=0, sticky="w", padx=10, pady=5)
+        
+        # Delete original images after conversion option
+        self.delete_originals_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(options_frame, text="Delete Original Images After Conversion", 
+                      variable=self.delete_originals_var).grid(row=3, column=0, sticky="w", padx=10, pady=5)
+        
+        # Skip images without caption option
+        self.skip_no_caption_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(options_frame, text="Skip Images Without Caption File", 
+                      variable=self.skip_no_caption_var).grid(row=4, column=0, sticky="w", padx=10, pady=5)
+        
+        # Maximum output size option (0 keeps the original dimensions)
+        size_frame = ttk.Frame(options_frame)
+        size_frame.grid(row=5, column=0, sticky="w", padx=10, pady=5)
+        ttk.Label(size_frame, text="Max Size (px, 0 = original):").pack(side=tk.LEFT)
+        self.max_size_var = tk.IntVar(value=0)
+        digits_only = (self.root.register(lambda v: v == "" or v.isdigit()), "%P")
+        ttk.Entry(size_frame, textvariable=self.max_size_var, width=6,
+                  validate="key", validatecommand=digits_only).pack(side=tk.LEFT, padx=5)
+        
+        # Create Process button
+        process_btn = ttk.Button(form_frame, text="Process Images", 
+                               command=self.start_processing, padding=(20, 10))
+        process_btn.grid(row=4, column=0, columnspan=3, pady=20)
+        
+        # Create log panel (right side)
+        log_frame = ttk.LabelFrame(main_frame, text="Processing Log")
+        log_frame.grid(row=0, column=1, sticky="nsew", padx=5, pady=5)
+        log_frame.rowconfigure(0, weight=1)
+        log_frame.columnconfigure(0, weight=1)
+        
+        # Log text widget with scrollbar
+        self.log_scrollbar = ttk.Scrollbar(log_frame)
+        self.log_scrollbar.grid(row=0, column=1, sticky="ns")
+        
+        self.log_text = tk.Text(log_frame, wrap=tk.WORD, 
+                               yscrollcommand=self.log_scrollbar.set,
+                               background="#f8f8f8")
+        self.log_text.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
+        self.log_scrollbar.config(command=self.log_text.yview)
+
+        # Autoscroll toggle so users can pause the view during long runs
+        self.autoscroll_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(log_frame, text="Autoscroll",
+                      variable=self.autoscroll_var).grid(row=1, column=0, sticky="w", padx=5, pady=(0, 5))
+        
+        # Status bar
+        self.status_var = tk.StringVar()
+        self.status_var.set("Ready")
+        self.status_bar = tk.Label(self.root, textvariable=self.status_var, bd=1, 
+                                  relief=tk.SUNKEN, anchor=tk.W)
+        self.status_bar.grid(row=2, column=0, sticky="ew")
+        
+        # Progress bar
+        self.progress_bar = ttk.Progressbar(self.root, orient="horizontal", 
+                                         length=100, mode="determinate")
+        self.progress_bar.grid(row=3, column=0, sticky="ew", padx=10, pady=5)
+        
+        # Queue drains are event-driven: workers generate <<QueueMsg>>
+        # after each put, with a slow polling fallback for safety
+        self.root.bind("<<QueueMsg>>", self.check_queue)
+        self._queue_after_id = self.root.after(500, self.check_queue)
+    
+    def browse_image_dir(self):
+        """Open dialog to browse for image directory"""
+        directory = filedialog.askdirectory()
+        if directory:
+            self.image_dir_var.set(directory)
+            # If "Same as Source Directory" is checked, update destination directory too
+            if self.same_dir_var.get():
+                self.dest_dir_var.set(directory)
+    
+    def browse_dest_dir(self):
+        """Open dialog to browse for destination directory"""
+        directory = filedialog.askdirectory()
+        if directory:
+            self.dest_dir_var.set(directory)
+    
+    def toggle_dest_dir(self):
+        """Toggle destination directory based on checkbox"""
+        if self.same_dir_var.get():
+            # Use source directory as destination
+            self.dest_dir_var.set(self.image_dir_var.get())
+            # Disable destination directory entry
+            for widget in self.root.winfo_children():
+                if isinstance(widget, ttk.Entry) and widget.cget("textvariable") == str(self.dest_dir_var):
+                    widget.configure(state="disabled")
+        else:
+            # Enable destination directory entry
+            for widget in self.root.winfo_children():
+                if isinstance(widget, ttk.Entry) and widget.cget("textvariable") == str(self.dest_dir_var):
+                    widget.configure(state="normal")
+    
+    def _queue_put(self, item):
+        """Post a message and wake the UI thread"""
+        self.msgs.append(item)
+        try:
+            self.root.event_generate("<<QueueMsg>>", when="tail")
+        except tk.TclError:
+            pass  # window is being torn down
+
+    def log_message(self, message):
+        """Add a message to the log"""
+        self._queue_put(("log", message))
+
+    def update_status(self, message):
+        """Update the status bar message"""
+        self._queue_put(("status", message))
+
+    def update_progress(self, value):
+        """Update the progress bar value"""
+        self._queue_put(("progress", value))
+
+    def check_queue(self, _event=None):
+        """Drain pending messages from the worker thread"""
+        if self._queue_after_id is not None:
+            self.root.after_cancel(self._queue_after_id)
+            self._queue_after_id = None
+
+        inserted = False
+        while self.msgs:
+            message_type, message = self.msgs.popleft()
+
+            if message_type == "log_batch":
+                # Pre-joined block of lines: a single insert
+                self.log_text.insert(tk.END, message)
+                inserted = True
+            elif message_type == "log":
+                self.log_text.insert(tk.END, message + "\n")
+                inserted = True
+            elif message_type == "status":
+                self.status_var.set(message)
+            elif message_type == "progress":
+                self.progress_bar["value"] = message
+            elif message_type == "done":
+                # Non-blocking completion notice: a modal dialog here
+                # would freeze the event loop mid-drain
+                self.progress_bar["value"] = 0
+                self.status_var.set(f"✓ {message}")
+
+        if inserted:
+            # Keep the widget to a rolling window and scroll once per
+            # drain, not per line
+            lines = int(self.log_text.index('end-1c').split('.')[0])
+            if lines > 5000:
+                self.log_text.delete('1.0', f'{lines - 5000}.0')
+            if self.autoscroll_var.get():
+                self.log_text.see(tk.END)
+
+        # Polling fallback in case an event is ever missed
+        self._queue_after_id = self.root.after(500, self.check_queue)
+    
+    def start_processing(self):
+        """Start processing images in a separate thread"""
+        # Get the image directory
+        image_directory = self.image_dir_var.get()
+        
+        if not image_directory or not os.path.isdir(image_directory):
+            messagebox.showerror("Error", "Please select a valid image directory.")
+            return
+        
+        # Get destination directory
+        if self.same_dir_var.get():
+            dest_directory = image_directory
+        else:
+            dest_directory = self.dest_dir_var.get()
+            if not dest_directory:
+                messagebox.showerror("Error", "Please select a destination directory.")
+                return
+            
+            # Create destination directory if it doesn't exist; exist_ok
+            # avoids the separate exists() stat and its race window
+            try:
+                os.makedirs(dest_directory, exist_ok=True)
+            except OSError as e:
+                messagebox.showerror("Error", f"Failed to create destination directory: {e}")
+                return
+        
+        # Clear the log
+        self.log_text.delete(1.0, tk.END)
+        
+        # Get options
+        process_subdirs = self.process_subdirs_var.get()
+        delete_txt = self.delete_txt_var.get()
+        convert_images = self.convert_images_var.get()
+        delete_originals = self.delete_originals_var.get()
+        skip_no_caption = self.skip_no_caption_var.get()
+        try:
+            max_size = self.max_size_var.get()
+        except tk.TclError:
+            max_size = 0
+        
+        # Start processing in a separate thread
+        self.processing_thread = threading.Thread(
+            target=self.process_images,
+            args=(image_directory, dest_directory, process_subdirs, delete_txt, convert_images, delete_originals, skip_no_caption, max_size)
+        )
+        self.processing_thread.daemon = True
+        self.processing_thread.start()
+        
+        self.update_status("Processing images...")
+    
+    def process_images(self, image_folder, dest_folder, process_subdirs, delete_txt, convert_images, delete_originals, skip_no_caption=False, max_size=0):
+        """Process images and add metadata from text files
+
+        No compiled (Numba/Cython) helpers here by design: the hot work
+        is JPEG decode/encode and EXIF patching, which already runs in C
+        inside Pillow/libjpeg and piexif with the GIL released, spread
+        across worker processes. The pure-Python part is path handling
+        and dispatch, far too little to justify a build step.
+        """
+        try:
+            # Define supported image formats
+            supported = frozenset(
+                JPEG_FORMATS + (CONVERTIBLE_FORMATS if convert_images else ()))
+
+            # Discovery streams straight into the pool: the first images
+            # start converting while the tree walk is still running, and
+            # memory is bounded by the submission window, not tree size
+            files_iter = _iter_images(image_folder, supported, process_subdirs)
+
+            # Fan the per-file work out across cores: PIL decode/encode
+            # is CPU-bound and the GIL would serialize it in threads
+            total_processed = 0
+            files_done = 0
+            pending_unlinks = []
+
+            # Coalesce worker log lines: flush every 64 lines or 200ms
+            # as one pre-joined block instead of a tuple per line
+            pending_logs = []
+            last_flush = time.monotonic()
+
+            def flush_logs(force=False):
+                nonlocal last_flush
+                if not pending_logs:
+                    return
+                now = time.monotonic()
+                if force or len(pending_logs) >= 64 or now - last_flush >= 0.2:
+                    self._queue_put(("log_batch", "\n".join(pending_logs) + "\n"))
+                    pending_logs.clear()
+                    last_flush = now
+
+            worker = partial(
+                _process_one,
+                image_folder=image_folder,
+                dest_folder=dest_folder,
+                process_subdirs=process_subdirs,
+                delete_txt=delete_txt,
+                convert_images=convert_images,
+                delete_originals=delete_originals,
+                skip_no_caption=skip_no_caption,
+                max_size=max_size)
+
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                pending = set()
+                window = (os.cpu_count() or 1) * 4
+
+                def reap(done):
+                    nonlocal total_processed, files_done
+                    for future in done:
+                        log_lines, processed, unlinks = future.result()
+                        pending_logs.extend(log_lines)
+                        pending_unlinks.extend(unlinks)
+                        if processed:
+                            total_processed += 1
+                        files_done += 1
+                    flush_logs()
+                    # Streaming estimate: completed vs completed+queued
+                    denom = files_done + len(pending)
+                    self.update_progress(files_done * 100 // max(denom, 1))
+
+                for item in files_iter:
+                    pending.add(executor.submit(worker, item))
+                    if len(pending) >= window:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        reap(done)
+
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    reap(done)
+
+            # Deferred removals in one tight pass, after the heavy work
+            for path in pending_unlinks:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+
+            flush_logs(force=True)
+
+            if files_done == 0:
+                self.log_message("No supported image files found in the selected directory.")
+                self.update_status("No images found")
+                self._queue_put(("done", "No images found"))
+                return
+
+            # Final update
+            self.update_progress(100)
+            message = f"Completed! Processed {total_processed} images."
+            self.log_message(message)
+            self._queue_put(("done", message))
+
+        except Exception as e:
+            error_message = f"Error during processing: {str(e)}"
+            self.log_message(error_message)
+            self._queue_put(("done", error_message))
+
+# Run the application
+if __name__ == "__main__":
+    root = tk.Tk()
+    app = ImageMetadataApp(root)
     root.mainloop()
\ No newline at end of file